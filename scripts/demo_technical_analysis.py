@@ -1,9 +1,15 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
+import numpy as np
+import matplotlib
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Without a terminal (or on CI) there is nobody to look at a window, so render
+# straight to PNG files with the in-memory Agg backend
+if not sys.stdout.isatty() or os.environ.get('CI'):
+    matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
 
 # Add the src directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -11,8 +17,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 from financial_analysis import FinancialAnalyzer
 
 # Set the style for plots
-plt.style.use('seaborn')
-sns.set_palette("husl")
+plt.style.use('seaborn-v0_8-darkgrid')
 
 def analyze_stock(ticker='AAPL', period='1y'):
     """
@@ -93,6 +98,79 @@ def analyze_stock(ticker='AAPL', period='1y'):
     else:
         print(f"Failed to fetch data for {ticker}. Please check the ticker symbol and try again.")
 
+def analyze_many(tickers, period='1y', max_workers=16):
+    """
+    Fetch and analyze several tickers.
+    
+    All tickers are downloaded in one batched yfinance request; the indicator
+    kernels release the GIL, so they then run concurrently on a thread pool.
+    
+    Args:
+        tickers (list): Stock ticker symbols
+        period (str): Time period to analyze (default: '1y')
+        max_workers (int): Maximum number of concurrent tickers (default: 16)
+    
+    Returns:
+        dict: Upper-cased ticker symbol -> FinancialAnalyzer (None if fetching
+            failed); repeated symbols are analyzed once
+    """
+    # fetch_batch upper-cases symbols, so 'AAPL' and 'aapl' would share one
+    # frame and two threads would write indicator columns into it at once
+    tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+    
+    try:
+        frames = FinancialAnalyzer.fetch_batch(tickers, period=period)
+    except Exception as e:
+        print(f"Error fetching data for {', '.join(tickers)}: {str(e)}")
+        return {ticker: None for ticker in tickers}
+    
+    analyzers = {}
+    for ticker in tickers:
+        analyzer = FinancialAnalyzer(ticker=ticker, period=period)
+        analyzer.data = frames.get(ticker)
+        has_data = analyzer.data is not None and not analyzer.data.empty
+        analyzers[ticker] = analyzer if has_data else None
+    
+    valid = [analyzer for analyzer in analyzers.values() if analyzer is not None]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(FinancialAnalyzer.calculate_indicators, valid))
+    return analyzers
+
+def print_overview(analyzers):
+    """
+    Print a one-line technical summary per ticker.
+    
+    Args:
+        analyzers (dict): Ticker symbol -> FinancialAnalyzer, as returned by analyze_many
+    """
+    print(f"{'Ticker':<8}{'Close':>10}{'Change':>10}{'RSI':>8}  {'SMA Cross':<14}{'MACD Trend':<10}")
+    print("-" * 62)
+    for ticker, analyzer in analyzers.items():
+        if analyzer is None:
+            print(f"{ticker:<8}  failed to fetch data")
+            continue
+        summary = analyzer.get_technical_summary()
+        print(f"{ticker:<8}{summary['price']['close']:>10.2f}"
+              f"{summary['price']['change_pct']:>+9.2f}%"
+              f"{summary['rsi']['value']:>8.2f}  "
+              f"{summary['moving_averages']['sma_cross']:<14}"
+              f"{summary['macd']['trend']:<10}")
+
+def show_figure(fig, filename):
+    """
+    Show a figure interactively, or save it as a PNG when using the Agg backend.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figure to display
+        filename (str): Output file name used when saving
+    """
+    if matplotlib.get_backend().lower() == 'agg':
+        fig.savefig(filename, dpi=100, bbox_inches='tight')
+        print(f"Saved chart to {filename}")
+    else:
+        plt.show()
+    plt.close(fig)
+
 def plot_additional_analysis(analyzer):
     """
     Generate additional analysis plots.
@@ -118,7 +196,8 @@ def plot_additional_analysis(analyzer):
     ax1.grid(True, alpha=0.3)
     
     # Plot volume
-    ax2.bar(data.index, data['Volume'], color='gray', alpha=0.7, label='Volume')
+    ax2.vlines(data.index, 0, data['Volume'].to_numpy(), colors='gray', alpha=0.7,
+               linewidth=1.5, label='Volume')
     ax2.set_ylabel('Volume')
     ax2.grid(True, alpha=0.3)
     
@@ -133,7 +212,7 @@ def plot_additional_analysis(analyzer):
     ax2.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
     
     plt.tight_layout()
-    plt.show()
+    show_figure(fig, f'{ticker}_chart1.png')
     
     # Create a new figure for RSI and MACD
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
@@ -153,28 +232,31 @@ def plot_additional_analysis(analyzer):
     # Plot MACD
     ax2.plot(data.index, data['MACD_12_26_9'], label='MACD', color='blue')
     ax2.plot(data.index, data['MACDs_12_26_9'], label='Signal Line', color='orange')
-    ax2.bar(data.index, data['MACDh_12_26_9'], 
-            color=['green' if x > 0 else 'red' for x in data['MACDh_12_26_9']], 
-            alpha=0.5, label='Histogram')
+    hist = data['MACDh_12_26_9'].to_numpy()
+    ax2.vlines(data.index, 0, hist, colors=np.where(hist > 0, 'green', 'red'),
+               alpha=0.5, linewidth=1.5, label='Histogram')
     ax2.axhline(0, color='black', linewidth=0.5, alpha=0.5)
     ax2.set_title(f'{ticker} - Moving Average Convergence Divergence (MACD)')
     ax2.legend()
     ax2.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.show()
+    show_figure(fig, f'{ticker}_chart2.png')
 
 if __name__ == "__main__":
     import argparse
     
     # Set up command line argument parsing
     parser = argparse.ArgumentParser(description='Perform technical analysis on a stock.')
-    parser.add_argument('ticker', type=str, nargs='?', default='AAPL',
-                       help='Stock ticker symbol (default: AAPL)')
+    parser.add_argument('tickers', type=str, nargs='*', default=['AAPL'],
+                       help='Stock ticker symbol(s) (default: AAPL)')
     parser.add_argument('--period', type=str, default='1y',
                        help='Time period to analyze (default: 1y)')
     
     args = parser.parse_args()
     
-    # Run the analysis
-    analyze_stock(ticker=args.ticker, period=args.period)
+    # Run the analysis; several tickers get a compact overview instead of charts
+    if len(args.tickers) == 1:
+        analyze_stock(ticker=args.tickers[0], period=args.period)
+    else:
+        print_overview(analyze_many(args.tickers, period=args.period))
@@ -1,16 +1,406 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
 import yfinance as yf
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
-from ta import add_all_ta_features
-from ta.utils import dropna
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+
+# On-disk cache for downloaded price history
+CACHE_DIR = Path.home() / ".cache" / "finanalyzer"
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+# Output columns of the indicator kernels, in the order they are returned
+INDICATOR_COLUMNS = ['SMA_20', 'SMA_50', 'SMA_200',
+                     'BBL_20_2.0', 'BBM_20_2.0', 'BBU_20_2.0', 'BBB_20_2.0', 'BBP_20_2.0',
+                     'RSI', 'MACD_12_26_9', 'MACDh_12_26_9', 'MACDs_12_26_9', 'VWAP']
+
+try:
+    from numba import njit, types
+    NUMBA_AVAILABLE = True
+    
+    # An explicit signature makes the fused kernel compile (or load from the
+    # on-disk cache) at import time instead of on the first call. Inputs are
+    # typed as read-only so pandas' copy-on-write views are accepted as well.
+    # The kernel releases the GIL so several tickers can be computed on
+    # threads at once.
+    _F8 = types.Array(types.float64, 1, 'A', readonly=True)
+    _I8 = types.Array(types.int64, 1, 'A', readonly=True)
+    _ALL_INDICATORS_SIGNATURE = types.UniTuple(types.float64[:], 13)(_F8, _F8, _F8, _F8, _I8)
+except ImportError:
+    NUMBA_AVAILABLE = False
+    _ALL_INDICATORS_SIGNATURE = None
+    
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit when numba is not installed: the decorated
+        function simply runs as plain Python.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def _read_cache(path):
+    """
+    Load a cached DataFrame.
+    
+    Returns:
+        pd.DataFrame: The cached frame, or None if it is missing, unreadable or
+            no Parquet engine is installed
+    """
+    try:
+        return pd.read_parquet(path)
+    except (OSError, ValueError, ImportError):
+        return None
+
+
+def _write_cache(data, path):
+    """
+    Cache a DataFrame and delete copies of the same ticker and period from
+    earlier days. The cache is best-effort: I/O errors and a missing Parquet
+    engine are ignored.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data.to_parquet(path)
+        prefix = path.name.rsplit('_', 1)[0]
+        for old in path.parent.glob(f"{prefix}_*.parquet"):
+            if old != path:
+                old.unlink()
+    except (OSError, ImportError):
+        pass
+
+
+def _sma(close, length):
+    """
+    Simple moving average over a float64 array.
+    
+    Args:
+        close (np.ndarray): Closing prices
+        length (int): Window length
+    
+    Returns:
+        np.ndarray: Moving average, NaN until the window is full
+    """
+    if bn is not None:
+        # bottleneck rejects windows longer than the input
+        if len(close) < length:
+            return np.full(len(close), np.nan)
+        return bn.move_mean(close, length, min_count=length)
+    return pd.Series(close).rolling(length).mean().to_numpy()
+
+
+def _bbands(close, length, mult):
+    """
+    Bollinger Bands from a moving mean and population standard deviation.
+    
+    Args:
+        close (np.ndarray): Closing prices
+        length (int): Window length
+        mult (float): Number of standard deviations for the bands
+    
+    Returns:
+        tuple: (lower, mid, upper) arrays, NaN until the window is full
+    """
+    if len(close) < length:
+        empty = np.full(len(close), np.nan)
+        return empty, empty.copy(), empty.copy()
+    if bn is not None:
+        mid = bn.move_mean(close, length, min_count=length)
+        std = bn.move_std(close, length, min_count=length, ddof=0)
+    else:
+        rolling = pd.Series(close).rolling(length)
+        mid = rolling.mean().to_numpy()
+        std = rolling.std(ddof=0).to_numpy()
+    return mid - mult * std, mid, mid + mult * std
+
+
+def _vwap(high, low, close, volume, session):
+    """
+    Volume Weighted Average Price, anchored to the start of each session.
+    
+    Args:
+        high, low, close, volume (np.ndarray): Price and volume arrays
+        session (np.ndarray): Session id per bar; the running sums reset
+            whenever it changes
+    
+    Returns:
+        np.ndarray: VWAP for every bar
+    """
+    pv = np.cumsum((high + low + close) / 3.0 * volume)
+    vol = np.cumsum(volume)
+    
+    # Subtract the running totals carried over from previous sessions
+    starts = np.flatnonzero(np.diff(session)) + 1
+    if starts.size:
+        lengths = np.diff(np.concatenate(([0], starts, [len(close)])))
+        pv -= np.repeat(np.concatenate(([0.0], pv[starts - 1])), lengths)
+        vol -= np.repeat(np.concatenate(([0.0], vol[starts - 1])), lengths)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return pv / vol
+
+
+def _rsi_wilder(close, length):
+    """
+    Relative Strength Index using Wilder's smoothing.
+    
+    Args:
+        close (np.ndarray): Closing prices as float64
+        length (int): Smoothing period
+    
+    Returns:
+        np.ndarray: RSI values, NaN for the first `length` bars
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    if n <= length:
+        return out
+    
+    # Seed the averages with the simple mean of the first `length` changes
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, length + 1):
+        change = close[i] - close[i - 1]
+        if change > 0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= length
+    avg_loss /= length
+    out[length] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    
+    for i in range(length + 1, n):
+        change = close[i] - close[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain = (avg_gain * (length - 1) + gain) / length
+        avg_loss = (avg_loss * (length - 1) + loss) / length
+        out[i] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    
+    return out
+
+
+def _macd(close, fast=12, slow=26, signal=9):
+    """
+    MACD line, signal line and histogram computed in a single pass.
+    
+    Args:
+        close (np.ndarray): Closing prices as float64
+        fast (int): Period of the fast EMA (default: 12)
+        slow (int): Period of the slow EMA (default: 26)
+        signal (int): Period of the signal EMA (default: 9)
+    
+    Returns:
+        tuple: (macd, signal, histogram) arrays, NaN during the warm-up
+    """
+    n = close.shape[0]
+    macd = np.full(n, np.nan)
+    signal_line = np.full(n, np.nan)
+    hist = np.full(n, np.nan)
+    if n == 0:
+        return macd, signal_line, hist
+    
+    a_fast = 2.0 / (fast + 1)
+    a_slow = 2.0 / (slow + 1)
+    a_signal = 2.0 / (signal + 1)
+    ema_fast = close[0]
+    ema_slow = close[0]
+    sig = 0.0
+    for i in range(1, n):
+        ema_fast += a_fast * (close[i] - ema_fast)
+        ema_slow += a_slow * (close[i] - ema_slow)
+        m = ema_fast - ema_slow
+        sig += a_signal * (m - sig)
+        if i >= slow - 1:
+            macd[i] = m
+        if i >= slow + signal - 2:
+            signal_line[i] = sig
+            hist[i] = m - sig
+    
+    return macd, signal_line, hist
+
+
+@njit(_ALL_INDICATORS_SIGNATURE, cache=True, error_model='numpy', nogil=True)
+def _all_indicators(high, low, close, volume, session):
+    """
+    Compute every indicator column in a single pass over the price arrays.
+    
+    Keeps running sums for the SMAs, a sliding Welford mean/M2 for the
+    Bollinger Bands, Wilder averages for RSI, three EMA accumulators for
+    MACD and per-session cumulative sums for VWAP.
+    
+    Args:
+        high, low, close, volume (np.ndarray): float64 price and volume arrays
+        session (np.ndarray): int64 session id per bar for VWAP anchoring
+    
+    Returns:
+        tuple: One float64 array per entry of INDICATOR_COLUMNS, in that order
+    """
+    n = close.shape[0]
+    sma20 = np.full(n, np.nan)
+    sma50 = np.full(n, np.nan)
+    sma200 = np.full(n, np.nan)
+    bbl = np.full(n, np.nan)
+    bbm = np.full(n, np.nan)
+    bbu = np.full(n, np.nan)
+    bbb = np.full(n, np.nan)
+    bbp = np.full(n, np.nan)
+    rsi = np.full(n, np.nan)
+    macd = np.full(n, np.nan)
+    macdh = np.full(n, np.nan)
+    macds = np.full(n, np.nan)
+    vwap = np.full(n, np.nan)
+    
+    sum20 = 0.0
+    sum50 = 0.0
+    sum200 = 0.0
+    bb_mean = 0.0
+    bb_m2 = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    a_fast = 2.0 / 13.0
+    a_slow = 2.0 / 27.0
+    a_signal = 2.0 / 10.0
+    ema_fast = 0.0
+    ema_slow = 0.0
+    sig = 0.0
+    cum_pv = 0.0
+    cum_v = 0.0
+    
+    for i in range(n):
+        x = close[i]
+        
+        # Simple moving averages: add the newest close, drop the oldest
+        sum20 += x
+        sum50 += x
+        sum200 += x
+        if i >= 20:
+            sum20 -= close[i - 20]
+        if i >= 50:
+            sum50 -= close[i - 50]
+        if i >= 200:
+            sum200 -= close[i - 200]
+        if i >= 19:
+            sma20[i] = sum20 / 20.0
+        if i >= 49:
+            sma50[i] = sum50 / 50.0
+        if i >= 199:
+            sma200[i] = sum200 / 200.0
+        
+        # Bollinger Bands (20, 2): Welford over the growing, then sliding window
+        if i < 20:
+            delta = x - bb_mean
+            bb_mean += delta / (i + 1)
+            bb_m2 += delta * (x - bb_mean)
+        else:
+            old = close[i - 20]
+            new_mean = bb_mean + (x - old) / 20.0
+            bb_m2 += (x - old) * (x - new_mean + old - bb_mean)
+            bb_mean = new_mean
+        if i >= 19:
+            std = np.sqrt(max(bb_m2, 0.0) / 20.0)
+            upper = bb_mean + 2.0 * std
+            lower = bb_mean - 2.0 * std
+            width = upper - lower
+            bbl[i] = lower
+            bbm[i] = bb_mean
+            bbu[i] = upper
+            bbb[i] = width / bb_mean * 100.0
+            bbp[i] = (x - lower) / width if width != 0 else np.nan
+        
+        # RSI (14) with Wilder smoothing, seeded by the mean of the first 14 changes
+        if i > 0:
+            change = x - close[i - 1]
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            if i <= 14:
+                avg_gain += gain / 14.0
+                avg_loss += loss / 14.0
+            else:
+                avg_gain = (avg_gain * 13.0 + gain) / 14.0
+                avg_loss = (avg_loss * 13.0 + loss) / 14.0
+            if i >= 14:
+                rsi[i] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        
+        # MACD (12, 26, 9), EMAs seeded from the first close
+        if i == 0:
+            ema_fast = x
+            ema_slow = x
+        else:
+            ema_fast += a_fast * (x - ema_fast)
+            ema_slow += a_slow * (x - ema_slow)
+            m = ema_fast - ema_slow
+            sig += a_signal * (m - sig)
+            if i >= 25:
+                macd[i] = m
+            if i >= 33:
+                macds[i] = sig
+                macdh[i] = m - sig
+        
+        # VWAP, reset at each new session
+        if i > 0 and session[i] != session[i - 1]:
+            cum_pv = 0.0
+            cum_v = 0.0
+        cum_pv += (high[i] + low[i] + x) / 3.0 * volume[i]
+        cum_v += volume[i]
+        if cum_v != 0:
+            vwap[i] = cum_pv / cum_v
+    
+    return (sma20, sma50, sma200, bbl, bbm, bbu, bbb, bbp,
+            rsi, macd, macdh, macds, vwap)
+
+
+def _indicators_vectorized(high, low, close, volume, session):
+    """
+    Per-indicator equivalent of _all_indicators, used when numba is not
+    installed and the fused loop would run as plain Python.
+    
+    Args:
+        high, low, close, volume (np.ndarray): float64 price and volume arrays
+        session (np.ndarray): int64 session id per bar for VWAP anchoring
+    
+    Returns:
+        tuple: One float64 array per entry of INDICATOR_COLUMNS, in that order
+    """
+    lower, mid, upper = _bbands(close, 20, 2.0)
+    width = upper - lower
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # A flat window has zero width; report NaN like _all_indicators does
+        percent_b = np.where(width != 0, (close - lower) / width, np.nan)
+    macd, signal, hist = _macd(close, 12, 26, 9)
+    return (_sma(close, 20), _sma(close, 50), _sma(close, 200),
+            lower, mid, upper, width / mid * 100, percent_b,
+            _rsi_wilder(close, 14), macd, hist, signal,
+            _vwap(high, low, close, volume, session))
+
 
 class FinancialAnalyzer:
     """
     A class to perform financial analysis on stock data including technical indicators.
     """
     
+    # Columns read by get_technical_summary and their positions in its row lists
+    SUMMARY_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume',
+                       'SMA_20', 'SMA_50', 'SMA_200',
+                       'BBU_20_2.0', 'BBL_20_2.0', 'BBP_20_2.0', 'RSI',
+                       'MACD_12_26_9', 'MACDs_12_26_9', 'MACDh_12_26_9', 'VWAP']
+    _COL = {name: i for i, name in enumerate(SUMMARY_COLUMNS)}
+    
+    # Columns kept in the streaming buffers used by update()
+    STREAM_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume'] + INDICATOR_COLUMNS
+    
+    # Summary verdicts, indexed by (first condition) + 2 * (second condition)
+    SMA_CROSS_LABELS = ('No Cross', 'Golden Cross', 'Death Cross')
+    BB_POSITION_LABELS = ('Between Bands', 'Upper Band', 'Lower Band')
+    RSI_SIGNAL_LABELS = ('Neutral', 'Overbought', 'Oversold')
+    MACD_TREND_LABELS = ('Neutral', 'Bullish', 'Bearish')
+    
     def __init__(self, ticker: str, period: str = "1y"):
         """
         Initialize the FinancialAnalyzer with a stock ticker and time period.
@@ -24,17 +414,97 @@ class FinancialAnalyzer:
         self.data = None
         self.indicators = {}
     
-    def fetch_data(self) -> pd.DataFrame:
+    @property
+    def data(self) -> pd.DataFrame:
+        """
+        Price history with any calculated indicators, including bars added
+        through update().
+        """
+        # Streamed bars are written back in one batch when the frame is read
+        if self._buffers is not None and self._flushed < self._size:
+            self._flush_stream()
+        return self._data
+    
+    @data.setter
+    def data(self, value: pd.DataFrame):
+        # New history invalidates any streaming state built on the old one
+        self._data = value
+        self._buffers = None
+    
+    @classmethod
+    def fetch_batch(cls, tickers: List[str], period: str = "1y",
+                    force_refresh: bool = False) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch historical data for several tickers with one yfinance download.
+        
+        Results are cached as Parquet under CACHE_DIR, one file per ticker,
+        period and (UTC) day; only tickers without a cached copy are downloaded.
+        Writing a new day's file removes the older ones for that ticker and period.
+        
+        Args:
+            tickers (list): Stock ticker symbols (e.g., ['AAPL', 'MSFT'])
+            period (str): Time period to fetch data for (default: "1y")
+            force_refresh (bool): Ignore any cached copies and download again
+                (default: False)
+        
+        Returns:
+            dict: Upper-cased ticker -> DataFrame of its stock data (empty if
+                yfinance returned nothing for it)
+        """
+        tickers = [ticker.upper() for ticker in tickers]
+        day = f"{datetime.now(timezone.utc):%Y%m%d}"
+        paths = {ticker: CACHE_DIR / f"{ticker}_{period}_{day}.parquet" for ticker in tickers}
+        
+        frames = {}
+        if not force_refresh:
+            for ticker, path in paths.items():
+                cached = _read_cache(path)
+                if cached is not None:
+                    frames[ticker] = cached
+        
+        missing = [ticker for ticker in tickers if ticker not in frames]
+        if missing:
+            # auto_adjust matches Ticker.history(); older releases default to False
+            raw = yf.download(' '.join(missing), period=period, group_by='ticker',
+                              auto_adjust=True, threads=True, progress=False)
+            if len(missing) == 1 and not isinstance(raw.columns, pd.MultiIndex):
+                # yfinance releases before multi_level_index return flat
+                # OHLCV columns for a single ticker
+                raw = pd.concat({missing[0]: raw}, axis=1)
+            downloaded = set(raw.columns.get_level_values(0))
+            for ticker in missing:
+                if ticker not in downloaded:
+                    frames[ticker] = pd.DataFrame()
+                    continue
+                data = raw[ticker].rename_axis(columns=None).dropna()
+                data['Volume'] = data['Volume'].astype(np.int64)
+                
+                if not data.empty:
+                    _write_cache(data, paths[ticker])
+                frames[ticker] = data
+        
+        return frames
+    
+    def fetch_data(self, force_refresh: bool = False) -> pd.DataFrame:
         """
         Fetch historical stock data using yfinance.
         
+        This is fetch_batch() for a single ticker, so it shares its Parquet cache.
+        
+        Args:
+            force_refresh (bool): Ignore any cached copy and download again
+                (default: False)
+        
         Returns:
-            pd.DataFrame: DataFrame containing the stock data
+            pd.DataFrame: DataFrame containing the stock data, or None if no
+                data could be fetched
         """
         try:
-            stock = yf.Ticker(self.ticker)
-            self.data = stock.history(period=self.period)
-            self.data = dropna(self.data)
+            data = self.fetch_batch([self.ticker], self.period, force_refresh)[self.ticker]
+            if data.empty:
+                print(f"No data found for {self.ticker}.")
+                return None
+            self.data = data
             return self.data
         except Exception as e:
             print(f"Error fetching data for {self.ticker}: {str(e)}")
@@ -42,31 +512,22 @@ class FinancialAnalyzer:
     
     def calculate_indicators(self):
         """
-        Calculate various technical indicators using pandas_ta and ta libraries.
+        Calculate SMA, Bollinger Bands, RSI, MACD and VWAP in a single numba pass.
         """
         if self.data is None:
             print("No data available. Please fetch data first using fetch_data().")
             return
         
-        # Simple Moving Averages
-        self.data['SMA_20'] = ta.sma(self.data['Close'], length=20)
-        self.data['SMA_50'] = ta.sma(self.data['Close'], length=50)
-        self.data['SMA_200'] = ta.sma(self.data['Close'], length=200)
-        
-        # Bollinger Bands
-        bollinger = ta.bbands(self.data['Close'], length=20, std=2)
-        self.data = pd.concat([self.data, bollinger], axis=1)
-        
-        # RSI (Relative Strength Index)
-        self.data['RSI'] = ta.rsi(self.data['Close'], length=14)
-        
-        # MACD (Moving Average Convergence Divergence)
-        macd = ta.macd(self.data['Close'])
-        self.data = pd.concat([self.data, macd], axis=1)
+        high = self.data['High'].to_numpy(dtype=np.float64)
+        low = self.data['Low'].to_numpy(dtype=np.float64)
+        close = self.data['Close'].to_numpy(dtype=np.float64)
+        volume = self.data['Volume'].to_numpy(dtype=np.float64)
+        session = self.data.index.normalize().astype('int64').to_numpy()
         
-        # Volume Weighted Average Price (VWAP)
-        self.data['VWAP'] = ta.vwap(self.data['High'], self.data['Low'], 
-                                   self.data['Close'], self.data['Volume'])
+        # One fused pass when numba can compile it, one pass per indicator otherwise
+        kernel = _all_indicators if NUMBA_AVAILABLE else _indicators_vectorized
+        for name, values in zip(INDICATOR_COLUMNS, kernel(high, low, close, volume, session)):
+            self.data[name] = values
         
         # Store the indicator names for reference
         self.indicators = {
@@ -85,6 +546,10 @@ class FinancialAnalyzer:
             print("No data or indicators available. Please fetch data and calculate indicators first.")
             return
         
+        # plotly is only needed for charts, so keep it off the import path
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         # Create subplots
         fig = make_subplots(rows=4, cols=1, shared_xaxes=True, 
                           vertical_spacing=0.03, 
@@ -94,59 +559,62 @@ class FinancialAnalyzer:
                                          'RSI', 
                                          'Volume'))
         
-        # Add Price and Moving Averages
-        fig.add_trace(go.Candlestick(x=self.data.index,
-                                    open=self.data['Open'],
-                                    high=self.data['High'],
-                                    low=self.data['Low'],
-                                    close=self.data['Close'],
-                                    name='Price'),
-                     row=1, col=1)
+        # Price and moving averages
+        traces = [go.Candlestick(x=self.data.index,
+                                 open=self.data['Open'],
+                                 high=self.data['High'],
+                                 low=self.data['Low'],
+                                 close=self.data['Close'],
+                                 name='Price')]
+        rows = [1]
         
         for ma in self.indicators['moving_averages']:
-            fig.add_trace(go.Scatter(x=self.data.index, 
-                                   y=self.data[ma], 
-                                   name=ma,
-                                   line=dict(width=1)),
-                        row=1, col=1)
-        
-        # Add Bollinger Bands
-        fig.add_trace(go.Scatter(x=self.data.index, 
-                               y=self.data['BBU_20_2.0'], 
-                               name='Upper BB',
-                               line=dict(width=1, color='gray'),
-                               opacity=0.7),
-                     row=2, col=1)
-        fig.add_trace(go.Scatter(x=self.data.index, 
-                               y=self.data['BBL_20_2.0'], 
-                               name='Lower BB',
-                               line=dict(width=1, color='gray'),
-                               opacity=0.7,
-                               fill='tonexty'),
-                     row=2, col=1)
-        fig.add_trace(go.Scatter(x=self.data.index, 
-                               y=self.data['BBM_20_2.0'], 
-                               name='Middle BB',
-                               line=dict(width=1, color='black', dash='dash'),
-                               opacity=0.7),
-                     row=2, col=1)
-        
-        # Add RSI
-        fig.add_trace(go.Scatter(x=self.data.index, 
-                               y=self.data['RSI'], 
-                               name='RSI',
-                               line=dict(width=1, color='purple')),
-                     row=3, col=1)
+            traces.append(go.Scattergl(x=self.data.index, 
+                                       y=self.data[ma], 
+                                       name=ma,
+                                       line=dict(width=1)))
+            rows.append(1)
+        
+        # Bollinger Bands
+        traces += [
+            go.Scattergl(x=self.data.index, 
+                         y=self.data['BBU_20_2.0'], 
+                         name='Upper BB',
+                         line=dict(width=1, color='gray'),
+                         opacity=0.7),
+            go.Scattergl(x=self.data.index, 
+                         y=self.data['BBL_20_2.0'], 
+                         name='Lower BB',
+                         line=dict(width=1, color='gray'),
+                         opacity=0.7,
+                         fill='tonexty'),
+            go.Scattergl(x=self.data.index, 
+                         y=self.data['BBM_20_2.0'], 
+                         name='Middle BB',
+                         line=dict(width=1, color='black', dash='dash'),
+                         opacity=0.7)
+        ]
+        rows += [2, 2, 2]
+        
+        # RSI
+        traces.append(go.Scattergl(x=self.data.index, 
+                                   y=self.data['RSI'], 
+                                   name='RSI',
+                                   line=dict(width=1, color='purple')))
+        rows.append(3)
+        
+        # Volume
+        traces.append(go.Bar(x=self.data.index, 
+                             y=self.data['Volume'],
+                             name='Volume'))
+        rows.append(4)
+        
+        fig.add_traces(traces, rows=rows, cols=[1] * len(traces))
+        
         # Add RSI boundaries
         fig.add_hline(y=70, line_dash="dash", line_color="red", row=3, col=1)
         fig.add_hline(y=30, line_dash="dash", line_color="green", row=3, col=1)
         
-        # Add Volume
-        fig.add_trace(go.Bar(x=self.data.index, 
-                           y=self.data['Volume'],
-                           name='Volume'),
-                     row=4, col=1)
-        
         # Update layout
         fig.update_layout(
             title=f'Technical Analysis - {self.ticker}',
@@ -177,53 +645,281 @@ class FinancialAnalyzer:
             print("No data or indicators available. Please fetch data and calculate indicators first.")
             return {}
         
-        latest = self.data.iloc[-1]
-        prev = self.data.iloc[-2]
+        # Convert only the last two rows; selecting columns first would copy
+        # every row of those columns
+        tail = self.data.iloc[-2:]
+        prev_row, latest_row = tail.to_numpy(dtype=np.float64).tolist()
+        position = {name: i for i, name in enumerate(tail.columns)}
+        latest = [latest_row[position[name]] for name in self.SUMMARY_COLUMNS]
+        prev = [prev_row[position[name]] for name in self.SUMMARY_COLUMNS]
+        return self._build_summary(self.data.index[-1], latest, prev)
+    
+    def _build_summary(self, date, latest: list, prev: list) -> dict:
+        """
+        Build the technical summary from the last two rows of SUMMARY_COLUMNS.
+        
+        Args:
+            date (pd.Timestamp): Timestamp of the latest row
+            latest (list): Latest row values, in SUMMARY_COLUMNS order
+            prev (list): Previous row values, in SUMMARY_COLUMNS order
+        
+        Returns:
+            dict: Dictionary containing technical analysis summary
+        """
+        c = self._COL
+        
+        close = latest[c['Close']]
+        prev_close = prev[c['Close']]
+        sma20, sma50, sma200 = latest[c['SMA_20']], latest[c['SMA_50']], latest[c['SMA_200']]
+        prev_sma50, prev_sma200 = prev[c['SMA_50']], prev[c['SMA_200']]
+        rsi = latest[c['RSI']]
+        macd, macd_signal = latest[c['MACD_12_26_9']], latest[c['MACDs_12_26_9']]
+        macd_hist, prev_macd_hist = latest[c['MACDh_12_26_9']], prev[c['MACDh_12_26_9']]
+        vwap = latest[c['VWAP']]
+        
+        # Conditions are mutually exclusive, so each pair maps to one label index
+        golden_cross = (sma50 > sma200) & (prev_sma50 <= prev_sma200)
+        death_cross = (sma50 < sma200) & (prev_sma50 >= prev_sma200)
+        above_band = close > latest[c['BBU_20_2.0']]
+        below_band = close < latest[c['BBL_20_2.0']]
+        bullish = (macd > macd_signal) & (macd_hist > prev_macd_hist)
+        bearish = (macd < macd_signal) & (macd_hist < prev_macd_hist)
         
         summary = {
             'ticker': self.ticker,
-            'date': latest.name.strftime('%Y-%m-%d'),
+            'date': date.strftime('%Y-%m-%d'),
             'price': {
-                'close': latest['Close'],
-                'change': latest['Close'] - prev['Close'],
-                'change_pct': ((latest['Close'] - prev['Close']) / prev['Close']) * 100
+                'close': close,
+                'change': close - prev_close,
+                'change_pct': ((close - prev_close) / prev_close) * 100
             },
             'moving_averages': {
-                'price_vs_sma20': (latest['Close'] - latest['SMA_20']) / latest['SMA_20'] * 100,
-                'price_vs_sma50': (latest['Close'] - latest['SMA_50']) / latest['SMA_50'] * 100,
-                'price_vs_sma200': (latest['Close'] - latest['SMA_200']) / latest['SMA_200'] * 100,
-                'sma_cross': 'Golden Cross' if latest['SMA_50'] > latest['SMA_200'] and prev['SMA_50'] <= prev['SMA_200']
-                            else 'Death Cross' if latest['SMA_50'] < latest['SMA_200'] and prev['SMA_50'] >= prev['SMA_200']
-                            else 'No Cross'
+                'price_vs_sma20': (close - sma20) / sma20 * 100,
+                'price_vs_sma50': (close - sma50) / sma50 * 100,
+                'price_vs_sma200': (close - sma200) / sma200 * 100,
+                'sma_cross': self.SMA_CROSS_LABELS[golden_cross + 2 * death_cross]
             },
             'bollinger_bands': {
-                'bb_percent': latest['BBP_20_2.0'],
-                'position': 'Upper Band' if latest['Close'] > latest['BBU_20_2.0']
-                           else 'Lower Band' if latest['Close'] < latest['BBL_20_2.0']
-                           else 'Between Bands'
+                'bb_percent': latest[c['BBP_20_2.0']],
+                'position': self.BB_POSITION_LABELS[above_band + 2 * below_band]
             },
             'rsi': {
-                'value': latest['RSI'],
-                'signal': 'Overbought' if latest['RSI'] > 70
-                         else 'Oversold' if latest['RSI'] < 30
-                         else 'Neutral'
+                'value': rsi,
+                'signal': self.RSI_SIGNAL_LABELS[(rsi > 70) + 2 * (rsi < 30)]
             },
             'macd': {
-                'value': latest['MACD_12_26_9'],
-                'signal': latest['MACDs_12_26_9'],
-                'histogram': latest['MACDh_12_26_9'],
-                'trend': 'Bullish' if latest['MACD_12_26_9'] > latest['MACDs_12_26_9'] and latest['MACDh_12_26_9'] > prev['MACDh_12_26_9']
-                         else 'Bearish' if latest['MACD_12_26_9'] < latest['MACDs_12_26_9'] and latest['MACDh_12_26_9'] < prev['MACDh_12_26_9']
-                         else 'Neutral'
+                'value': macd,
+                'signal': macd_signal,
+                'histogram': macd_hist,
+                'trend': self.MACD_TREND_LABELS[bullish + 2 * bearish]
             },
             'vwap': {
-                'value': latest['VWAP'],
-                'price_vs_vwap': (latest['Close'] - latest['VWAP']) / latest['VWAP'] * 100
+                'value': vwap,
+                'price_vs_vwap': (close - vwap) / vwap * 100
             }
         }
         
         return summary
 
+    
+    def update(self, bar: pd.Series) -> dict:
+        """
+        Append one new bar and update every indicator incrementally.
+        
+        EMA, Wilder RSI and VWAP state is carried between calls, so each bar
+        costs O(1) for those and O(window) for the SMAs and Bollinger Bands,
+        instead of recomputing the whole history. New bars go into
+        preallocated buffers and are appended to self.data in one batch the
+        next time it is read, so reading self.data after every bar costs a
+        full copy of the frame; prefer latest_summary() inside a replay loop.
+        
+        Args:
+            bar (pd.Series): One OHLCV row named by its timestamp, e.g. a row
+                of another DataFrame returned by fetch_data()
+        
+        Returns:
+            dict: Indicator values for the new bar
+        """
+        if self._data is None:
+            print("No data available. Please fetch data first using fetch_data().")
+            return {}
+        
+        if self._buffers is None:
+            self._init_stream()
+        
+        i = self._size
+        self._append_bar(bar.name, float(bar['Open']), float(bar['High']), float(bar['Low']),
+                         float(bar['Close']), float(bar['Volume']))
+        return {name: float(self._buffers[name][i]) for name in INDICATOR_COLUMNS}
+    
+    def latest_summary(self) -> dict:
+        """
+        Generate the technical summary for the most recent bar straight from
+        the streaming buffers, without touching self.data.
+        
+        Returns:
+            dict: Dictionary containing technical analysis summary
+        """
+        if self._buffers is None or self._size < 2:
+            print("No streamed bars available. Please add bars first using update().")
+            return {}
+        
+        latest = [float(self._buffers[name][self._size - 1]) for name in self.SUMMARY_COLUMNS]
+        prev = [float(self._buffers[name][self._size - 2]) for name in self.SUMMARY_COLUMNS]
+        return self._build_summary(self._stream_index[-1], latest, prev)
+    
+    def _init_stream(self):
+        """
+        Seed the streaming buffers from the existing indicator columns and
+        rebuild the recurrence state of _all_indicators with vectorized passes.
+        """
+        if any(name not in self._data.columns for name in INDICATOR_COLUMNS):
+            self.calculate_indicators()
+        
+        data = self._data
+        n = len(data)
+        capacity = max(2 * n, 256)
+        self._buffers = {name: np.full(capacity, np.nan) for name in self.STREAM_COLUMNS}
+        for name in self.STREAM_COLUMNS:
+            self._buffers[name][:n] = data[name].to_numpy(dtype=np.float64)
+        self._stream_index = list(data.index)
+        self._size = n
+        self._flushed = n
+        
+        self._ema_fast = 0.0
+        self._ema_slow = 0.0
+        self._macd_signal = 0.0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._cum_pv = 0.0
+        self._cum_v = 0.0
+        self._session = None
+        if n == 0:
+            return
+        
+        close = self._buffers['Close'][:n]
+        
+        # MACD: EMAs seeded from the first close, signal seeded at zero
+        ema_fast = pd.Series(close).ewm(span=12, adjust=False).mean().to_numpy()
+        ema_slow = pd.Series(close).ewm(span=26, adjust=False).mean().to_numpy()
+        signal = pd.Series(ema_fast - ema_slow).ewm(span=9, adjust=False).mean().to_numpy()
+        self._ema_fast = ema_fast[-1]
+        self._ema_slow = ema_slow[-1]
+        self._macd_signal = signal[-1]
+        
+        # RSI: mean of the first 14 changes, then Wilder smoothing (alpha = 1/14)
+        change = np.diff(close)
+        gains = np.maximum(change, 0.0)
+        losses = np.maximum(-change, 0.0)
+        self._avg_gain = gains[:14].sum() / 14.0
+        self._avg_loss = losses[:14].sum() / 14.0
+        if len(change) > 14:
+            self._avg_gain = pd.Series(np.concatenate(([self._avg_gain], gains[14:]))).ewm(
+                alpha=1 / 14, adjust=False).mean().iloc[-1]
+            self._avg_loss = pd.Series(np.concatenate(([self._avg_loss], losses[14:]))).ewm(
+                alpha=1 / 14, adjust=False).mean().iloc[-1]
+        
+        # VWAP: running sums over the trailing session
+        session = data.index.normalize().astype('int64').to_numpy()
+        earlier = np.flatnonzero(session != session[-1])
+        start = earlier[-1] + 1 if earlier.size else 0
+        b = self._buffers
+        volume = b['Volume'][start:n]
+        self._cum_pv = float(((b['High'][start:n] + b['Low'][start:n] + close[start:]) / 3.0 * volume).sum())
+        self._cum_v = float(volume.sum())
+        self._session = data.index[-1].normalize()
+    
+    def _flush_stream(self):
+        """
+        Append the bars streamed since the last flush to the stored DataFrame.
+        """
+        start, end = self._flushed, self._size
+        index = pd.DatetimeIndex(self._stream_index[start:end], name=self._data.index.name)
+        new = pd.DataFrame({name: buf[start:end] for name, buf in self._buffers.items()}, index=index)
+        new = new.astype({name: self._data[name].dtype for name in new.columns if name in self._data.columns})
+        self._data = pd.concat([self._data, new])
+        self._flushed = end
+    
+    def _append_bar(self, timestamp, open_, high, low, close, volume):
+        """
+        Write one bar into the streaming buffers, using the same recurrences
+        and warm-up rules as _all_indicators.
+        """
+        i = self._size
+        if i == len(self._buffers['Close']):
+            # Double the capacity so appends stay amortized O(1)
+            for name, buf in self._buffers.items():
+                grown = np.full(2 * i, np.nan)
+                grown[:i] = buf
+                self._buffers[name] = grown
+        
+        b = self._buffers
+        b['Open'][i] = open_
+        b['High'][i] = high
+        b['Low'][i] = low
+        b['Close'][i] = close
+        b['Volume'][i] = volume
+        closes = b['Close']
+        
+        # Simple moving averages and Bollinger Bands over the trailing windows
+        for length, name in ((20, 'SMA_20'), (50, 'SMA_50'), (200, 'SMA_200')):
+            if i >= length - 1:
+                b[name][i] = closes[i - length + 1:i + 1].mean()
+        if i >= 19:
+            mid = b['SMA_20'][i]
+            std = closes[i - 19:i + 1].std()
+            upper = mid + 2.0 * std
+            lower = mid - 2.0 * std
+            width = upper - lower
+            b['BBL_20_2.0'][i] = lower
+            b['BBM_20_2.0'][i] = mid
+            b['BBU_20_2.0'][i] = upper
+            b['BBB_20_2.0'][i] = width / mid * 100.0
+            b['BBP_20_2.0'][i] = (close - lower) / width if width != 0 else np.nan
+        
+        # RSI (14) with Wilder smoothing
+        if i > 0:
+            change = close - closes[i - 1]
+            gain = max(change, 0.0)
+            loss = max(-change, 0.0)
+            if i <= 14:
+                self._avg_gain += gain / 14.0
+                self._avg_loss += loss / 14.0
+            else:
+                self._avg_gain = (self._avg_gain * 13.0 + gain) / 14.0
+                self._avg_loss = (self._avg_loss * 13.0 + loss) / 14.0
+            if i >= 14:
+                b['RSI'][i] = (100.0 if self._avg_loss == 0
+                               else 100.0 - 100.0 / (1.0 + self._avg_gain / self._avg_loss))
+        
+        # MACD (12, 26, 9)
+        if i == 0:
+            self._ema_fast = close
+            self._ema_slow = close
+        else:
+            self._ema_fast += 2.0 / 13.0 * (close - self._ema_fast)
+            self._ema_slow += 2.0 / 27.0 * (close - self._ema_slow)
+            macd = self._ema_fast - self._ema_slow
+            self._macd_signal += 2.0 / 10.0 * (macd - self._macd_signal)
+            if i >= 25:
+                b['MACD_12_26_9'][i] = macd
+            if i >= 33:
+                b['MACDs_12_26_9'][i] = self._macd_signal
+                b['MACDh_12_26_9'][i] = macd - self._macd_signal
+        
+        # VWAP, reset at each new session
+        session = pd.Timestamp(timestamp).normalize()
+        if session != self._session:
+            self._session = session
+            self._cum_pv = 0.0
+            self._cum_v = 0.0
+        self._cum_pv += (high + low + close) / 3.0 * volume
+        self._cum_v += volume
+        if self._cum_v != 0:
+            b['VWAP'][i] = self._cum_pv / self._cum_v
+        
+        self._stream_index.append(timestamp)
+        self._size = i + 1
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,249 @@
+import os
+import sys
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# Add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from financial_analysis import (INDICATOR_COLUMNS, FinancialAnalyzer, _all_indicators,
+                                _indicators_vectorized)
+
+try:
+    import talib
+except ImportError:
+    talib = None
+
+
+def make_prices(n=600, freq='D', seed=0):
+    """
+    Build a random-walk OHLCV DataFrame shaped like yfinance history.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    index = pd.date_range('2023-01-02 09:30', periods=n, freq=freq,
+                          tz='America/New_York', name='Date')
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.5, n),
+        'High': close + 1,
+        'Low': close - 1,
+        'Close': close,
+        'Volume': rng.integers(100_000, 1_000_000, n)
+    }, index=index)
+
+
+def kernel_inputs(data):
+    """
+    Arrays in the form calculate_indicators passes them to the kernels.
+    """
+    return (data['High'].to_numpy(dtype=np.float64),
+            data['Low'].to_numpy(dtype=np.float64),
+            data['Close'].to_numpy(dtype=np.float64),
+            data['Volume'].to_numpy(dtype=np.float64),
+            data.index.normalize().astype('int64').to_numpy())
+
+
+class TestIndicatorKernels(unittest.TestCase):
+
+    def assert_kernels_agree(self, data):
+        inputs = kernel_inputs(data)
+        fused = _all_indicators(*inputs)
+        vectorized = _indicators_vectorized(*inputs)
+        for name, a, b in zip(INDICATOR_COLUMNS, fused, vectorized):
+            np.testing.assert_allclose(a, b, rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=name)
+
+    def test_fused_matches_vectorized_daily(self):
+        self.assert_kernels_agree(make_prices())
+
+    def test_fused_matches_vectorized_intraday_sessions(self):
+        self.assert_kernels_agree(make_prices(freq='2h'))
+
+    def test_fused_handles_short_history(self):
+        self.assert_kernels_agree(make_prices(n=10))
+
+    def test_fused_matches_vectorized_flat_prices(self):
+        data = make_prices(n=300)
+        data[['Open', 'High', 'Low', 'Close']] = 100.0
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', RuntimeWarning)
+            self.assert_kernels_agree(data)
+
+    def test_fused_tolerates_nan_prices(self):
+        data = make_prices(n=300)
+        data.iloc[50, data.columns.get_loc('Close')] = np.nan
+        inputs = kernel_inputs(data)
+        fused = _all_indicators(*inputs)
+        vectorized = _indicators_vectorized(*inputs)
+        # NaN propagates differently through running sums and bottleneck's
+        # NaN-skipping windows, so only the bars before it must agree
+        for name, a, b in zip(INDICATOR_COLUMNS, fused, vectorized):
+            self.assertEqual(len(a), len(data))
+            np.testing.assert_allclose(a[:50], b[:50], rtol=1e-9, atol=1e-9,
+                                       equal_nan=True, err_msg=name)
+
+    @unittest.skipIf(talib is None, "TA-Lib is not installed")
+    def test_fused_matches_talib(self):
+        data = make_prices()
+        inputs = kernel_inputs(data)
+        close = inputs[2]
+        result = dict(zip(INDICATOR_COLUMNS, _all_indicators(*inputs)))
+        upper, mid, lower = talib.BBANDS(close, 20, 2, 2)
+        expected = {
+            'SMA_20': talib.SMA(close, 20),
+            'SMA_50': talib.SMA(close, 50),
+            'SMA_200': talib.SMA(close, 200),
+            'BBL_20_2.0': lower,
+            'BBM_20_2.0': mid,
+            'BBU_20_2.0': upper,
+            'RSI': talib.RSI(close, 14)
+        }
+        for name, values in expected.items():
+            np.testing.assert_allclose(result[name], values, rtol=1e-9, atol=1e-9,
+                                       equal_nan=True, err_msg=name)
+
+
+def make_download(tickers, n=30, nan_tickers=()):
+    """
+    Build a yf.download(group_by='ticker') result with (Ticker, Price) columns.
+    """
+    frames = {}
+    for ticker in tickers:
+        frame = make_prices(n=n)
+        if ticker in nan_tickers:
+            frame = frame.astype(np.float64) * np.nan
+        frames[ticker] = frame
+    raw = pd.concat(frames, axis=1)
+    raw.columns.names = ['Ticker', 'Price']
+    return raw
+
+
+class TestFetchBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch('financial_analysis.CACHE_DIR', Path(self.cache_dir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.cache_dir.cleanup)
+
+    def cached_tickers(self):
+        return sorted(path.name.split('_')[0] for path in Path(self.cache_dir.name).iterdir())
+
+    def test_splits_multiple_tickers(self):
+        with mock.patch('financial_analysis.yf.download',
+                        return_value=make_download(['AAPL', 'MSFT'])) as download:
+            frames = FinancialAnalyzer.fetch_batch(['aapl', 'msft'])
+        
+        download.assert_called_once()
+        self.assertEqual(download.call_args.args[0], 'AAPL MSFT')
+        self.assertEqual(sorted(frames), ['AAPL', 'MSFT'])
+        for frame in frames.values():
+            self.assertEqual(len(frame), 30)
+            self.assertEqual(list(frame.columns), ['Open', 'High', 'Low', 'Close', 'Volume'])
+            self.assertEqual(frame['Volume'].dtype, np.int64)
+        self.assertEqual(self.cached_tickers(), ['AAPL', 'MSFT'])
+
+    def test_wraps_flat_single_ticker_columns(self):
+        with mock.patch('financial_analysis.yf.download', return_value=make_prices(n=30)):
+            frames = FinancialAnalyzer.fetch_batch(['AAPL'])
+        
+        self.assertEqual(list(frames), ['AAPL'])
+        self.assertEqual(len(frames['AAPL']), 30)
+        self.assertEqual(frames['AAPL']['Close'].tolist(), make_prices(n=30)['Close'].tolist())
+
+    def test_all_nan_ticker_is_empty_and_not_cached(self):
+        raw = make_download(['AAPL', 'BAD'], nan_tickers=('BAD',))
+        with mock.patch('financial_analysis.yf.download', return_value=raw):
+            frames = FinancialAnalyzer.fetch_batch(['AAPL', 'BAD'])
+        
+        self.assertTrue(frames['BAD'].empty)
+        self.assertEqual(len(frames['AAPL']), 30)
+        self.assertEqual(self.cached_tickers(), ['AAPL'])
+
+    def test_empty_download(self):
+        with mock.patch('financial_analysis.yf.download', return_value=pd.DataFrame()):
+            frames = FinancialAnalyzer.fetch_batch(['BAD'])
+            self.assertIsNone(FinancialAnalyzer('BAD').fetch_data())
+        
+        self.assertTrue(frames['BAD'].empty)
+        self.assertEqual(self.cached_tickers(), [])
+
+    def test_cache_hit_skips_download(self):
+        with mock.patch('financial_analysis.yf.download', return_value=make_download(['AAPL'])):
+            first = FinancialAnalyzer.fetch_batch(['AAPL'])
+        
+        with mock.patch('financial_analysis.yf.download') as download:
+            second = FinancialAnalyzer.fetch_batch(['AAPL'])
+        
+        download.assert_not_called()
+        pd.testing.assert_frame_equal(second['AAPL'], first['AAPL'], check_freq=False)
+
+
+    def test_missing_parquet_engine_disables_cache(self):
+        no_engine = ImportError("Unable to find a usable engine")
+        with mock.patch('financial_analysis.yf.download', return_value=make_download(['AAPL'])), \
+                mock.patch('financial_analysis.pd.read_parquet', side_effect=no_engine), \
+                mock.patch.object(pd.DataFrame, 'to_parquet', side_effect=no_engine):
+            data = FinancialAnalyzer('AAPL').fetch_data()
+        
+        self.assertIsNotNone(data)
+        self.assertEqual(len(data), 30)
+        self.assertEqual(self.cached_tickers(), [])
+
+class TestStreamingUpdate(unittest.TestCase):
+
+    def stream(self, data, history):
+        analyzer = FinancialAnalyzer('TEST')
+        analyzer.data = data.iloc[:history].copy()
+        analyzer.calculate_indicators()
+        for _, bar in data.iloc[history:].iterrows():
+            analyzer.update(bar)
+        return analyzer
+
+    def assert_matches_batch(self, data, history):
+        streamed = self.stream(data, history)
+        batch = FinancialAnalyzer('TEST')
+        batch.data = data.copy()
+        batch.calculate_indicators()
+        
+        self.assertTrue(streamed.data.index.equals(batch.data.index))
+        for name in ['Close', 'Volume'] + INDICATOR_COLUMNS:
+            np.testing.assert_allclose(streamed.data[name].to_numpy(dtype=np.float64),
+                                       batch.data[name].to_numpy(dtype=np.float64),
+                                       rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=name)
+        self.assertEqual(streamed.data['Volume'].dtype, batch.data['Volume'].dtype)
+        
+        summary, expected = streamed.latest_summary(), batch.get_technical_summary()
+        self.assertEqual(summary['date'], expected['date'])
+        self.assertEqual(summary['moving_averages']['sma_cross'], expected['moving_averages']['sma_cross'])
+        self.assertEqual(summary['macd']['trend'], expected['macd']['trend'])
+        self.assertAlmostEqual(summary['rsi']['value'], expected['rsi']['value'])
+        self.assertAlmostEqual(summary['vwap']['value'], expected['vwap']['value'])
+
+    def test_stream_matches_batch_daily(self):
+        self.assert_matches_batch(make_prices(), history=100)
+
+    def test_stream_matches_batch_intraday_sessions(self):
+        self.assert_matches_batch(make_prices(freq='2h'), history=100)
+
+    def test_stream_from_short_history(self):
+        self.assert_matches_batch(make_prices(n=300), history=5)
+
+    def test_calculate_indicators_keeps_streamed_bars(self):
+        data = make_prices(n=300)
+        analyzer = self.stream(data.iloc[:250], history=200)
+        analyzer.calculate_indicators()
+        for _, bar in data.iloc[250:].iterrows():
+            analyzer.update(bar)
+        self.assertEqual(len(analyzer.data), 300)
+        self.assertTrue(analyzer.data.index.equals(data.index))
+
+
+if __name__ == '__main__':
+    unittest.main()